@@ -5,18 +5,89 @@
 文件I/O和运行时配置更新。
 """
 
+import functools
 import json
 import os
+import re
+import shutil
 from typing import Dict, Any, Optional
 from ..core.exceptions import ConfigurationError
 from ..utils.logging import get_logger
 from .defaults import DEFAULT_CONFIG
 from .validator import ConfigValidator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+# orjson reads integers outside the 64-bit range as floats instead of ints,
+# so text with digit runs that long goes straight to the standard library
+_LONG_DIGITS_RE = re.compile(r'\d{19,}')
+
+
+def _dumps_config(config: Dict[str, Any]) -> str:
+    """
+    Serialize configuration to indented JSON text.
+    
+    Uses orjson when it is installed, otherwise the standard library. Values
+    orjson cannot encode (non-str keys, integers beyond 64 bits) fall back to
+    the standard library so the result never depends on orjson being present.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(config, ensure_ascii=False, indent=2)
+
+
+def _loads_config(text: str) -> Any:
+    """
+    Parse JSON configuration text.
+    
+    Uses orjson when it is installed, otherwise the standard library. Text
+    orjson rejects or reads differently (NaN, Infinity, 1e999, integers
+    beyond 64 bits) is parsed with the standard library instead.
+    """
+    if orjson is not None and not _LONG_DIGITS_RE.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _copy_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a configuration dictionary one level deep.
+    
+    Top-level lists and dicts are copied so the copy never shares them with
+    the defaults; configuration values are not nested any deeper than that.
+    """
+    return {
+        key: value.copy() if isinstance(value, (list, dict)) else value
+        for key, value in config.items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _validated_defaults() -> Dict[str, Any]:
+    """
+    Validate the default configuration once per process.
+    
+    Returns:
+        Validated default configuration (callers must copy before modifying)
+    """
+    return ConfigValidator.validate_config(DEFAULT_CONFIG.copy())
+
 
 class ConfigManager:
     """具有验证和持久化功能的增强配置管理器。"""
     
+    __slots__ = ('config_file', 'logger', '_config', '_dirty')
+    
     def __init__(self, config_file: str = 'config.json'):
         """
         初始化配置管理器。
@@ -35,12 +106,13 @@ class ConfigManager:
         Returns:
             Loaded and validated configuration dictionary
         """
-        config = DEFAULT_CONFIG.copy()
+        config = _copy_config(DEFAULT_CONFIG)
+        file_config = None
         
         if os.path.exists(self.config_file):
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    file_config = json.load(f)
+                    file_config = _loads_config(f.read())
                 
                 # Merge with defaults (file config takes precedence)
                 config.update(file_config)
@@ -58,7 +130,10 @@ class ConfigManager:
         except ConfigurationError as e:
             self.logger.error(f"Configuration validation failed: {e}")
             self.logger.info("Falling back to default configuration")
-            config = ConfigValidator.validate_config(DEFAULT_CONFIG.copy())
+            config = _copy_config(_validated_defaults())
+        
+        # The file only needs rewriting if it differs from what was loaded
+        self._dirty = config != file_config
         
         return config
     
@@ -69,17 +144,32 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise
         """
+        if not self._dirty and os.path.exists(self.config_file):
+            self.logger.debug(f"Configuration unchanged, skipping save to {self.config_file}")
+            return True
+        
+        # Resolve symlinks so the swap replaces the real file, not the link
+        target_file = os.path.realpath(self.config_file)
+        temp_file = f"{target_file}.tmp"
         try:
-            # Validate before saving
-            ConfigValidator.validate_config(self._config)
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, ensure_ascii=False, indent=2)
+            # Every code path that changes self._config validates first,
+            # so the in-memory config is written without re-validation.
+            # Serialize before opening the temporary file, then swap it in
+            # so a failed write never leaves a truncated config behind.
+            data = _dumps_config(self._config)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(data)
+            if os.path.exists(target_file):
+                shutil.copymode(target_file, temp_file)
+            os.replace(temp_file, target_file)
             
+            self._dirty = False
             self.logger.info(f"Configuration saved to {self.config_file}")
             return True
             
-        except (ConfigurationError, IOError, json.JSONEncodeError) as e:
+        except (IOError, TypeError, ValueError) as e:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
             self.logger.error(f"Failed to save configuration: {e}")
             return False
     
@@ -108,15 +198,13 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            # Create temporary config for validation
-            temp_config = self._config.copy()
-            temp_config[key] = value
-            
-            # Validate the change
-            validated_config = ConfigValidator.validate_config(temp_config)
+            # Validate only the changed field; the rest is already validated
+            validated_value = ConfigValidator.validate_field(key, value)
             
             # Apply the change
-            self._config = validated_config
+            if key not in self._config or self._config[key] != validated_value:
+                self._config[key] = validated_value
+                self._dirty = True
             self.logger.debug(f"Configuration updated: {key} = {value}")
             return True
             
@@ -135,15 +223,17 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            # Create temporary config for validation
-            temp_config = self._config.copy()
-            temp_config.update(updates)
+            # Validate only the changed fields before applying any of them
+            validated_updates = {
+                key: ConfigValidator.validate_field(key, value)
+                for key, value in updates.items()
+            }
             
-            # Validate all changes
-            validated_config = ConfigValidator.validate_config(temp_config)
-            
-            # Apply all changes
-            self._config = validated_config
+            # Apply all changes at once
+            new_config = {**self._config, **validated_updates}
+            if new_config != self._config:
+                self._config = new_config
+                self._dirty = True
             self.logger.info(f"Configuration updated with {len(updates)} changes")
             return True
             
@@ -153,7 +243,10 @@ class ConfigManager:
     
     def reset_to_defaults(self) -> None:
         """将配置重置为默认值。"""
-        self._config = ConfigValidator.validate_config(DEFAULT_CONFIG.copy())
+        defaults = _copy_config(_validated_defaults())
+        if defaults != self._config:
+            self._config = defaults
+            self._dirty = True
         self.logger.info("配置已重置为默认值")
     
     def get_all(self) -> Dict[str, Any]:
@@ -181,7 +274,7 @@ class ConfigManager:
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                file_config = json.load(f)
+                file_config = _loads_config(f.read())
             
             # Merge with current config
             temp_config = self._config.copy()
@@ -193,6 +286,7 @@ class ConfigManager:
             # Apply
             self._config = validated_config
             self.config_file = file_path
+            self._dirty = validated_config != file_config
             self.logger.info(f"Configuration loaded from {file_path}")
             return True
             
@@ -212,12 +306,12 @@ class ConfigManager:
         """
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, ensure_ascii=False, indent=2)
+                f.write(_dumps_config(self._config))
             
             self.logger.info(f"Configuration exported to {file_path}")
             return True
             
-        except (IOError, json.JSONEncodeError) as e:
+        except (IOError, TypeError, ValueError) as e:
             self.logger.error(f"Failed to export configuration to {file_path}: {e}")
             return False
     
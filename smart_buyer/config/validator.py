@@ -5,9 +5,12 @@
 以确保它们满足应用程序的要求。
 """
 
+import math
 import os
-from typing import Dict, Any, List, Union
+import re
+from typing import Dict, Any, Callable, List, Union
 from ..core.exceptions import ConfigurationError, ValidationError
+from ..utils.helpers import compile_regex_pattern
 from .defaults import CONFIG_FIELD_TYPES, REQUIRED_CONFIG_FIELDS, VALID_LOG_LEVELS
 
 
@@ -34,13 +37,30 @@ class ConfigValidator:
         # Validate each field
         validated_config = {}
         for key, value in config.items():
-            try:
-                validated_config[key] = ConfigValidator._validate_field(key, value)
-            except ValidationError as e:
-                raise ConfigurationError(f"Invalid value for {key}", key, str(e))
+            validated_config[key] = ConfigValidator.validate_field(key, value)
         
         return validated_config
     
+    @staticmethod
+    def validate_field(key: str, value: Any) -> Any:
+        """
+        Validate a single configuration field.
+        
+        Args:
+            key: Configuration field name
+            value: Field value to validate
+            
+        Returns:
+            Validated value
+            
+        Raises:
+            ConfigurationError: If validation fails
+        """
+        try:
+            return ConfigValidator._validate_field(key, value)
+        except ValidationError as e:
+            raise ConfigurationError(f"Invalid value for {key}", key, str(e))
+    
     @staticmethod
     def _check_required_fields(config: Dict[str, Any]) -> None:
         """Check that all required fields are present."""
@@ -64,45 +84,31 @@ class ConfigValidator:
             ValidationError: If validation fails
         """
         # Check type
-        if key in CONFIG_FIELD_TYPES:
-            expected_type = CONFIG_FIELD_TYPES[key]
-            if not isinstance(value, expected_type):
-                raise ValidationError(f"Expected {expected_type}, got {type(value)}")
+        expected_type = CONFIG_FIELD_TYPES.get(key)
+        if expected_type is not None and not isinstance(value, expected_type):
+            raise ValidationError(f"Expected {expected_type}, got {type(value)}")
         
         # Field-specific validation
-        if key == "countdown_box":
-            return ConfigValidator._validate_bounding_box(value)
-        elif key in ["buy_btn_pos", "confirm_btn_pos"]:
-            return ConfigValidator._validate_point(value)
-        elif key == "tesseract_path":
-            return ConfigValidator._validate_tesseract_path(value)
-        elif key in ["click_delay", "check_interval"]:
-            return ConfigValidator._validate_positive_number(value)
-        elif key == "max_retries":
-            return ConfigValidator._validate_positive_integer(value)
-        elif key == "countdown_formats":
-            return ConfigValidator._validate_regex_patterns(value)
-        elif key == "log_level":
-            return ConfigValidator._validate_log_level(value)
-        elif key == "log_file":
-            return ConfigValidator._validate_file_path(value)
-        elif key == "image_enhancement":
-            return ConfigValidator._validate_image_enhancement(value)
-        elif key == "window_geometry":
-            return ConfigValidator._validate_window_geometry(value)
+        field_validator = _FIELD_VALIDATORS.get(key)
+        if field_validator is not None:
+            return field_validator(value)
         
         return value
     
     @staticmethod
     def _validate_bounding_box(bbox: List[int]) -> List[int]:
         """Validate bounding box coordinates."""
-        if not isinstance(bbox, list) or len(bbox) != 4:
+        if not isinstance(bbox, list):
             raise ValidationError("Bounding box must be a list of 4 integers")
         
-        if not all(isinstance(coord, int) for coord in bbox):
-            raise ValidationError("All bounding box coordinates must be integers")
+        try:
+            left, top, right, bottom = bbox
+        except ValueError:
+            raise ValidationError("Bounding box must be a list of 4 integers") from None
         
-        left, top, right, bottom = bbox
+        if not (isinstance(left, int) and isinstance(top, int)
+                and isinstance(right, int) and isinstance(bottom, int)):
+            raise ValidationError("All bounding box coordinates must be integers")
         
         if left >= right:
             raise ValidationError(f"Left ({left}) must be less than right ({right})")
@@ -110,7 +116,8 @@ class ConfigValidator:
         if top >= bottom:
             raise ValidationError(f"Top ({top}) must be less than bottom ({bottom})")
         
-        if any(coord < 0 for coord in bbox):
+        # right > left and bottom > top, so only left/top can be negative
+        if left < 0 or top < 0:
             raise ValidationError("All coordinates must be non-negative")
         
         return bbox
@@ -153,6 +160,9 @@ class ConfigValidator:
         if not isinstance(value, (int, float)):
             raise ValidationError("Value must be a number")
         
+        if not math.isfinite(value):
+            raise ValidationError("Value must be a finite number")
+        
         if value <= 0:
             raise ValidationError("Value must be positive")
         
@@ -178,14 +188,10 @@ class ConfigValidator:
         if not patterns:
             raise ValidationError("At least one pattern is required")
         
-        import re
         for pattern in patterns:
             if not isinstance(pattern, str):
                 raise ValidationError("All patterns must be strings")
-            try:
-                re.compile(pattern)
-            except re.error as e:
-                raise ValidationError(f"Invalid regex pattern '{pattern}': {e}")
+            compile_regex_pattern(pattern)
         
         return patterns
     
@@ -228,8 +234,8 @@ class ConfigValidator:
         
         if "contrast_factor" in config:
             factor = config["contrast_factor"]
-            if not isinstance(factor, (int, float)) or factor <= 0:
-                raise ValidationError("Contrast factor must be a positive number")
+            if not isinstance(factor, (int, float)) or not math.isfinite(factor) or factor <= 0:
+                raise ValidationError("Contrast factor must be a positive finite number")
         
         if "enable_grayscale" in config:
             if not isinstance(config["enable_grayscale"], bool):
@@ -243,8 +249,24 @@ class ConfigValidator:
         if not isinstance(geometry, str):
             raise ValidationError("Window geometry must be a string")
         
-        import re
         if not re.match(r'^\d+x\d+$', geometry):
             raise ValidationError("Window geometry must be in format 'WIDTHxHEIGHT'")
         
-        return geometry
\ No newline at end of file
+        return geometry
+
+
+# 字段名到专用验证函数的映射（导入时构建一次）
+_FIELD_VALIDATORS: Dict[str, Callable[[Any], Any]] = {
+    "countdown_box": ConfigValidator._validate_bounding_box,
+    "buy_btn_pos": ConfigValidator._validate_point,
+    "confirm_btn_pos": ConfigValidator._validate_point,
+    "tesseract_path": ConfigValidator._validate_tesseract_path,
+    "click_delay": ConfigValidator._validate_positive_number,
+    "check_interval": ConfigValidator._validate_positive_number,
+    "max_retries": ConfigValidator._validate_positive_integer,
+    "countdown_formats": ConfigValidator._validate_regex_patterns,
+    "log_level": ConfigValidator._validate_log_level,
+    "log_file": ConfigValidator._validate_file_path,
+    "image_enhancement": ConfigValidator._validate_image_enhancement,
+    "window_geometry": ConfigValidator._validate_window_geometry,
+}
\ No newline at end of file
@@ -5,9 +5,10 @@
 购买执行和带回调支持的状态管理。
 """
 
+import threading
 import time
 import pyautogui
-from typing import Optional, Callable, Tuple, List
+from typing import Optional, Callable, Tuple, List, Pattern
 from enum import Enum
 from ..core.exceptions import AutomationError
 from ..core.ocr import OCRProcessor
@@ -39,6 +40,7 @@ class AutomationEngine:
         self.state = AutomationState.IDLE
         self._is_running = False
         self._callback = None
+        self._stop_event = threading.Event()
     
     def start_monitoring(
         self,
@@ -73,11 +75,15 @@ class AutomationEngine:
         self.state = AutomationState.MONITORING
         self._is_running = True
         self._callback = callback
+        self._stop_event.clear()
         
         try:
+            # Compile countdown patterns once instead of on every check
+            compiled_formats = self.ocr_processor.compile_countdown_formats(countdown_formats)
+            
             self._monitor_countdown(
                 countdown_region=countdown_region,
-                countdown_formats=countdown_formats,
+                countdown_formats=compiled_formats,
                 check_interval=check_interval,
                 max_retries=max_retries
             )
@@ -104,13 +110,14 @@ class AutomationEngine:
         if self._is_running:
             self.logger.info("正在停止自动化引擎...")
             self._is_running = False
+            self._stop_event.set()
             self.state = AutomationState.STOPPED
             self._notify_callback("监控已停止")
     
     def _monitor_countdown(
         self,
         countdown_region: Tuple[int, int, int, int],
-        countdown_formats: List[str],
+        countdown_formats: List[Pattern[str]],
         check_interval: float,
         max_retries: int
     ) -> None:
@@ -119,16 +126,22 @@ class AutomationEngine:
         
         Args:
             countdown_region: Screen region for countdown detection
-            countdown_formats: List of regex patterns for countdown formats
+            countdown_formats: List of precompiled regex patterns for countdown formats
             check_interval: Interval between checks in seconds
             max_retries: Maximum consecutive failures allowed
         """
         retry_count = 0
         
+        # Bind hot-loop attributes to locals once
+        read_countdown = self.ocr_processor.read_countdown
+        notify = self._notify_callback
+        logger = self.logger
+        wait = self._stop_event.wait
+        
         while self._is_running:
             try:
                 # Read countdown value
-                seconds_remaining = self.ocr_processor.read_countdown(
+                seconds_remaining = read_countdown(
                     region=countdown_region,
                     countdown_formats=countdown_formats,
                     enable_preprocessing=True
@@ -136,36 +149,37 @@ class AutomationEngine:
                 
                 # Update status
                 if seconds_remaining is not None:
-                    self._notify_callback(f"剩余时间: {seconds_remaining}秒")
-                    self.logger.info(f"Countdown: {seconds_remaining} seconds remaining")
+                    notify(f"剩余时间: {seconds_remaining}秒")
+                    logger.info(f"Countdown: {seconds_remaining} seconds remaining")
                     retry_count = 0  # Reset retry count on successful read
                     
                     # Check if countdown has ended
                     if seconds_remaining <= 0:
-                        self.logger.info("Countdown reached zero, proceeding to purchase")
+                        logger.info("Countdown reached zero, proceeding to purchase")
                         break
                         
-                    # Wait for next check (but not longer than remaining time)
+                    # Wait for next check (but not longer than remaining time);
+                    # stop_monitoring() wakes the wait immediately
                     sleep_time = min(check_interval, seconds_remaining)
-                    time.sleep(sleep_time)
+                    wait(sleep_time)
                     
                 else:
                     # OCR failed
                     retry_count += 1
-                    self._notify_callback(f"倒计时识别失败 (重试 {retry_count}/{max_retries})")
-                    self.logger.warning(f"OCR failed, retry {retry_count}/{max_retries}")
+                    notify(f"倒计时识别失败 (重试 {retry_count}/{max_retries})")
+                    logger.warning(f"OCR failed, retry {retry_count}/{max_retries}")
                     
                     if retry_count >= max_retries:
-                        self.logger.warning("Max retries reached, assuming countdown ended")
-                        self._notify_callback("连续识别失败，可能倒计时已结束")
+                        logger.warning("Max retries reached, assuming countdown ended")
+                        notify("连续识别失败，可能倒计时已结束")
                         break
                     
-                    time.sleep(check_interval)
+                    wait(check_interval)
                     
             except Exception as e:
-                self.logger.error(f"Error during countdown monitoring: {e}")
-                self._notify_callback(f"监控过程出错: {e}")
-                time.sleep(check_interval)
+                logger.error(f"Error during countdown monitoring: {e}")
+                notify(f"监控过程出错: {e}")
+                wait(check_interval)
     
     def _execute_purchase(
         self,
@@ -226,9 +240,8 @@ class AutomationEngine:
             x, y = position
             self.logger.info(f"Clicking {button_name} at position ({x}, {y})")
             
-            # Move to position and click
-            pyautogui.moveTo(x, y, duration=delay)
-            pyautogui.click()
+            # Move to position and click in a single call
+            pyautogui.click(x=x, y=y, duration=delay)
             
             self.logger.info(f"Successfully clicked {button_name}")
             
@@ -244,11 +257,14 @@ class AutomationEngine:
         Args:
             message: 要发送的状态消息
         """
-        if self._callback:
-            try:
-                self._callback(message)
-            except Exception as e:
-                self.logger.warning(f"Callback notification failed: {e}")
+        callback = self._callback
+        if callback is None:
+            return
+        
+        try:
+            callback(message)
+        except Exception as e:
+            self.logger.warning(f"Callback notification failed: {e}")
     
     def get_state(self) -> AutomationState:
         """
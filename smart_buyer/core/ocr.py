@@ -5,11 +5,11 @@
 包括图像预处理和支持多种格式的文本解析。
 """
 
-import re
 import pytesseract
 from PIL import Image, ImageGrab, ImageEnhance
-from typing import Optional, List, Tuple
-from ..core.exceptions import OCRError
+from typing import Optional, List, Tuple, Pattern, Sequence, Union
+from ..core.exceptions import OCRError, ValidationError
+from ..utils.helpers import compile_regex_pattern
 from ..utils.logging import get_logger
 
 
@@ -36,7 +36,7 @@ class OCRProcessor:
     def read_countdown(
         self,
         region: Tuple[int, int, int, int],
-        countdown_formats: List[str],
+        countdown_formats: Sequence[Union[str, Pattern[str]]],
         enable_preprocessing: bool = True,
         contrast_factor: float = 2.0
     ) -> Optional[int]:
@@ -45,7 +45,7 @@ class OCRProcessor:
         
         参数:
             region: 屏幕区域，格式为(左, 上, 右, 下)
-            countdown_formats: 倒计时格式的正则表达式模式列表
+            countdown_formats: 倒计时格式的正则表达式模式列表（字符串或已编译模式）
             enable_preprocessing: 是否应用图像预处理
             contrast_factor: 对比度增强因子
             
@@ -146,39 +146,45 @@ class OCRProcessor:
         except Exception as e:
             raise OCRError(f"文本提取失败: {str(e)}")
     
-    def _parse_countdown(self, text: str, countdown_formats: List[str]) -> Optional[int]:
+    def _parse_countdown(
+        self,
+        text: str,
+        countdown_formats: Sequence[Union[str, Pattern[str]]]
+    ) -> Optional[int]:
         """
         使用多种格式模式从文本中解析倒计时值。
         
         参数:
             text: 要解析的文本
-            countdown_formats: 倒计时格式的正则表达式模式列表
+            countdown_formats: 倒计时格式的正则表达式模式列表（字符串或已编译模式）
             
         返回:
             倒计时值（秒），如果解析失败则返回None
         """
         for pattern in countdown_formats:
             try:
-                match = re.search(pattern, text)
+                if isinstance(pattern, str):
+                    pattern = compile_regex_pattern(pattern)
+                match = pattern.search(text)
                 if match:
                     groups = match.groups()
-                    seconds = self._convert_to_seconds(groups, pattern)
+                    seconds = self._convert_to_seconds(groups)
                     if seconds is not None:
                         return seconds
-            except re.error as e:
-                self.logger.warning(f"无效的正则表达式模式 '{pattern}': {e}")
+            except ValidationError as e:
+                self.logger.warning(f"无效的倒计时格式: {e}")
             except Exception as e:
-                self.logger.debug(f"使用模式 '{pattern}' 解析失败: {e}")
+                pattern_str = pattern if isinstance(pattern, str) else pattern.pattern
+                self.logger.debug(f"使用模式 '{pattern_str}' 解析失败: {e}")
         
         return None
     
-    def _convert_to_seconds(self, groups: Tuple[str, ...], pattern: str) -> Optional[int]:
+    def _convert_to_seconds(self, groups: Tuple[str, ...]) -> Optional[int]:
         """
-        根据模式将匹配的组转换为秒数。
+        根据匹配组的数量将其转换为秒数。
         
         参数:
             groups: 正则表达式匹配组
-            pattern: 原始正则表达式模式（用于上下文）
             
         返回:
             总秒数，如果转换失败则返回None
@@ -191,13 +197,8 @@ class OCRProcessor:
                 
             elif len(groups) == 2:
                 # MM分SS秒 格式或 MM:SS 格式
-                if '分' in pattern and '秒' in pattern:
-                    minutes, seconds = map(int, groups)
-                    return minutes * 60 + seconds
-                else:
-                    # 假设为 MM:SS 格式
-                    minutes, seconds = map(int, groups)
-                    return minutes * 60 + seconds
+                minutes, seconds = map(int, groups)
+                return minutes * 60 + seconds
                     
             elif len(groups) == 1:
                 # SS秒 格式或纯秒数
@@ -249,6 +250,26 @@ class OCRProcessor:
             self.logger.error(f"OCR测试失败: {e}")
             return None, False
     
+    def compile_countdown_formats(self, formats: List[str]) -> List[Pattern[str]]:
+        """
+        预编译倒计时格式模式，供监控循环重复使用。
+        
+        参数:
+            formats: 倒计时格式的正则表达式模式列表
+            
+        返回:
+            已编译的有效模式列表（无效模式会被跳过并记录警告）
+        """
+        compiled_formats = []
+        
+        for pattern in formats:
+            try:
+                compiled_formats.append(compile_regex_pattern(pattern))
+            except ValidationError as e:
+                self.logger.warning(f"无效的倒计时格式: {e}")
+        
+        return compiled_formats
+    
     def validate_countdown_formats(self, formats: List[str]) -> List[str]:
         """
         验证倒计时格式模式。
@@ -263,11 +284,11 @@ class OCRProcessor:
         
         for pattern in formats:
             try:
-                re.compile(pattern)
+                compile_regex_pattern(pattern)
                 valid_formats.append(pattern)
                 self.logger.debug(f"有效的倒计时格式: {pattern}")
-            except re.error as e:
-                self.logger.warning(f"无效的倒计时格式 '{pattern}': {e}")
+            except ValidationError as e:
+                self.logger.warning(f"无效的倒计时格式: {e}")
         
         if not valid_formats:
             self.logger.warning("未找到有效的倒计时格式")
@@ -9,7 +9,6 @@ import sys
 import os
 from typing import List, Optional
 from .ui.cli import CLIInterface
-from .ui.gui import GUIInterface
 from .utils.logging import setup_logging, get_logger
 from .core.exceptions import SmartBuyerError
 
@@ -52,7 +51,9 @@ def main(args: Optional[List[str]] = None) -> int:
             cli = CLIInterface()
             return cli.run(args)
         else:
-            # 运行GUI界面（默认）
+            # 运行GUI界面（默认），仅在需要时导入tkinter
+            from .ui.gui import GUIInterface
+            
             logger.info("在GUI模式下启动智能抢购助手")
             gui = GUIInterface()
             gui.run()
@@ -85,6 +86,7 @@ def gui_main() -> int:
         logger = get_logger(__name__)
         logger.info("Starting Smart Buyer GUI")
         
+        from .ui.gui import GUIInterface
         gui = GUIInterface()
         gui.run()
         return 0
@@ -6,7 +6,15 @@
 - 用于命令行使用的CLI界面
 """
 
-from .gui import GUIInterface
+from typing import Any
 from .cli import CLIInterface
 
-__all__ = ["GUIInterface", "CLIInterface"]
\ No newline at end of file
+__all__ = ["GUIInterface", "CLIInterface"]
+
+
+def __getattr__(name: str) -> Any:
+    """延迟导入GUI界面，使仅使用CLI时无需加载tkinter。"""
+    if name == "GUIInterface":
+        from .gui import GUIInterface
+        return GUIInterface
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
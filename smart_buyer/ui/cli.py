@@ -6,20 +6,49 @@
 """
 
 import argparse
+import functools
 import sys
 import time
-from typing import Optional, List
+from typing import Any, Optional, List
 from ..config.manager import ConfigManager
 from ..core.ocr import OCRProcessor
 from ..core.automation import AutomationEngine, AutomationState
 from ..core.exceptions import SmartBuyerError, ConfigurationError
 from ..utils.logging import get_logger, setup_logging
-from ..utils.helpers import format_time_remaining
+from ..utils.helpers import format_time_remaining, parse_coordinate_string
+
+
+# 被解析为True的布尔字符串
+_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on'})
+
+# 错误消息前缀
+_ERROR_PREFIX = "错误: "
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_config_value_cached(key: str, value: str) -> Any:
+    """Parse a non-coordinate configuration value from string, memoized by (key, value)."""
+    # Handle boolean values
+    if key in ['enable_confirm_click', 'enable_console_logging']:
+        return value.lower() in _TRUE_VALUES
+    
+    # Handle numeric values
+    if key in ['check_interval', 'click_delay']:
+        return float(value)
+    
+    if key in ['max_retries', 'min_countdown_value', 'max_countdown_value']:
+        return int(value)
+    
+    # Handle string values
+    return value
 
 
 class CLIInterface:
     """智能抢购助手的命令行界面。"""
     
+    # 参数解析器在所有实例间共享，首次使用时构建
+    _parser: Optional[argparse.ArgumentParser] = None
+    
     def __init__(self):
         """初始化CLI界面。"""
         self.logger = get_logger(__name__)
@@ -85,6 +114,19 @@ class CLIInterface:
         Returns:
             Parsed arguments namespace
         """
+        parser = CLIInterface._parser
+        if parser is None:
+            parser = CLIInterface._parser = self._build_parser()
+        
+        return parser.parse_args(args)
+    
+    def _build_parser(self) -> argparse.ArgumentParser:
+        """
+        Build the command line argument parser.
+        
+        Returns:
+            Configured argument parser
+        """
         parser = argparse.ArgumentParser(
             description="智能抢购助手 - 自动化购买工具",
             formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -178,7 +220,7 @@ class CLIInterface:
             help='禁用确认按钮点击'
         )
         
-        return parser.parse_args(args)
+        return parser
     
     def _execute_command(self, args: argparse.Namespace) -> int:
         """
@@ -487,24 +529,11 @@ class CLIInterface:
     
     def _parse_config_value(self, key: str, value: str):
         """根据键类型从字符串解析配置值。"""
-        # Handle list values (coordinates)
+        # Handle list values (coordinates); parse_coordinate_string caches itself
         if key in ['countdown_box', 'buy_btn_pos', 'confirm_btn_pos']:
-            from ..utils.helpers import parse_coordinate_string
             return parse_coordinate_string(value)
         
-        # Handle boolean values
-        if key in ['enable_confirm_click', 'enable_console_logging']:
-            return value.lower() in ('true', '1', 'yes', 'on')
-        
-        # Handle numeric values
-        if key in ['check_interval', 'click_delay']:
-            return float(value)
-        
-        if key in ['max_retries', 'min_countdown_value', 'max_countdown_value']:
-            return int(value)
-        
-        # Handle string values
-        return value
+        return _parse_config_value_cached(key, value)
     
     def _get_config_value(self, key: str) -> int:
         """
@@ -569,9 +598,10 @@ class CLIInterface:
     
     def _print_message(self, message: str) -> None:
         """如果不在静默模式下则打印消息。"""
-        if not self.quiet:
-            print(message)
+        if self.quiet:
+            return
+        print(message)
     
     def _print_error(self, message: str) -> None:
         """将错误消息打印到stderr。"""
-        print(f"错误: {message}", file=sys.stderr)
\ No newline at end of file
+        sys.stderr.write(_ERROR_PREFIX + message + "\n")
\ No newline at end of file
@@ -4,12 +4,18 @@
 此模块包含在不同组件中使用的通用实用函数。
 """
 
+import functools
+import re
 import time
 import pyautogui
-from typing import Tuple, List, Union, Optional
+from typing import Dict, Tuple, List, Pattern, Union, Optional
 from ..core.exceptions import ValidationError
 
 
+# 已编译的正则表达式缓存（模式字符串 -> 编译结果），配置验证和OCR共用
+_COMPILED_PATTERNS: Dict[str, Pattern[str]] = {}
+
+
 def get_mouse_position_after_delay(delay: float = 3.0) -> Tuple[int, int]:
     """
     在指定延迟后获取鼠标位置。
@@ -44,18 +50,23 @@ def parse_coordinate_string(coord_str: str) -> List[int]:
     异常:
         ValidationError: 如果坐标字符串无效
     """
+    return list(_parse_coordinate_string_cached(coord_str))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_coordinate_string_cached(coord_str: str) -> Tuple[int, ...]:
+    """解析坐标字符串并缓存结果（返回不可变元组，异常不会被缓存）。"""
     try:
-        # 移除括号并按逗号分割
-        coord_str = coord_str.strip("[]()").replace(" ", "")
-        coords = [int(x.strip()) for x in coord_str.split(",") if x.strip()]
-        
-        if not coords:
-            raise ValidationError("空坐标字符串")
-            
-        return coords
-        
+        # 移除空白和括号后按逗号分割（int()会忽略数字两侧的空白）
+        parts = coord_str.strip().strip("[]()").split(",")
+        coords = tuple(int(part) for part in parts if part.strip())
     except (ValueError, AttributeError) as e:
-        raise ValidationError(f"无效的坐标格式: {coord_str}", details=str(e))
+        raise ValidationError(f"无效的坐标格式: {coord_str} ({e})", value=coord_str)
+    
+    if not coords:
+        raise ValidationError("空坐标字符串", value=coord_str)
+    
+    return coords
 
 
 def validate_bounding_box(bbox: List[int]) -> bool:
@@ -112,6 +123,30 @@ def validate_point_coordinates(point: List[int]) -> bool:
     return True
 
 
+def compile_regex_pattern(pattern: str) -> Pattern[str]:
+    """
+    编译正则表达式模式，已编译过的模式直接复用缓存。
+    
+    Args:
+        pattern: 正则表达式模式字符串
+        
+    Returns:
+        已编译的模式
+        
+    Raises:
+        ValidationError: 如果模式不是有效的正则表达式
+    """
+    compiled = _COMPILED_PATTERNS.get(pattern)
+    if compiled is None:
+        try:
+            compiled = re.compile(pattern)
+        except re.error as e:
+            raise ValidationError(f"Invalid regex pattern '{pattern}': {e}")
+        _COMPILED_PATTERNS[pattern] = compiled
+    
+    return compiled
+
+
 def format_time_remaining(seconds: Optional[int]) -> str:
     """
     将剩余时间格式化为人类可读的格式。